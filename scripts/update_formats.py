@@ -2,402 +2,475 @@
 import re
 import sys
 import os
+from itertools import chain, tee, zip_longest
 from pathlib import Path
 
-def parse_markdown_formats(md_content):
-    """Parse the markdown file to extract property formats"""
-    property_formats = {}
-    lines = md_content.split('\n')
-    in_css_example = False
-    
-    for i, line in enumerate(lines):
-        trimmed = line.strip()
-        
-        # Check if we're entering or leaving a code block
-        if trimmed.startswith('```'):
-            continue
-        
-        # Detect CSS example blocks
-        if line.startswith('    '):
-            code_line = line[4:]  # Remove the 4-space indentation
-            if code_line.strip().startswith('.') and '{' in code_line:
-                in_css_example = True
-            if code_line.strip() == '}' and in_css_example:
-                in_css_example = False
-                continue
-        
-        # Skip if we're in a CSS example block
-        if in_css_example:
-            continue
-        
-        # Check if this line is indented (indicating it's in a code block)
-        if line.startswith('    ') and line.strip():
-            code_line = line[4:]  # Remove the 4-space indentation
-            
-            # Skip comments
-            if code_line.strip().startswith('/*') or code_line.strip().startswith('*/'):
-                continue
-            
-            # Look for property definitions (property: format)
-            if ':' in code_line:
-                colon_pos = code_line.find(':')
-                property_name = code_line[:colon_pos].strip()
-                format_spec = code_line[colon_pos + 1:].strip()
-                
-                # Skip empty property names or format specs
-                if not property_name or not format_spec:
-                    continue
-                
-                # Skip CSS selectors and other non-property lines
-                if ('.' in property_name or '#' in property_name or 
-                    ' ' in property_name or property_name.startswith('@')):
-                    continue
-                
-                # Skip lines that look like CSS values
-                if (format_spec.endswith(';') and 
-                    ('px' in format_spec or 'red' in format_spec or 
-                     'blue' in format_spec or '0.5' in format_spec or
-                     format_spec == 'initial;' or len(format_spec) < 20)):
-                    continue
-                
-                # Only process lines that look like actual format specifications
-                if '<' not in format_spec and '|' not in format_spec:
-                    continue
-                
-                property_formats[property_name] = format_spec
-    
-    return property_formats
+# Patterns used inside the per-line parser loops, compiled once at import time
+_BACKTICK_RE = re.compile(r'`([^`]+)`')
+_CSS_DECL_RE = re.compile(r'([a-zA-Z-]+)\s*:\s*([^;]+);')
 
-def parse_unity_examples(md_content):
-    """Parse Unity USS documentation to extract property examples"""
-    property_examples = {}
-    lines = md_content.split('\n')
-    
-    # List of transition properties we want to find examples for
-    transition_properties = [
-        'transition-property',
-        'transition-duration', 
-        'transition-timing-function',
-        'transition-delay',
-        'transition'
-    ]
-    
-    # Also look for other properties with ### headings
-    current_property = None
-    in_examples_section = False
-    examples_buffer = []
-    
-    for i, line in enumerate(lines):
-        # Look for property sections (### property-name or ## property-name)
-        if line.startswith('###') or line.startswith('##'):
-            # Save previous property examples if any
-            if current_property and examples_buffer:
-                property_examples[current_property] = '\n'.join(examples_buffer).strip()
-                examples_buffer = []
-            
-            # Extract property name from heading
-            heading_text = line.strip('#').strip()
-            if '`' in heading_text:
-                # Extract property name from backticks
-                match = re.search(r'`([^`]+)`', heading_text)
-                if match:
-                    current_property = match.group(1)
-                    in_examples_section = False
-            else:
-                current_property = None
-                in_examples_section = False
-        
-        # Look for "Examples" section
-        elif line.strip() == '**Examples**' or line.strip().lower() == 'examples' or 'USS examples' in line or line.strip() == '### USS examples' or line.strip() == '### C# examples':
-            in_examples_section = True
-            examples_buffer = []
+# Patterns used to rewrite property_data.rs. A PropertyInfo block is matched from its
+# opening brace up to the `format:` field (or the closing brace), skipping over string
+# literals so that braces and field names inside strings don't end the block early.
+_RUST_STRING = r'"(?:[^"\\]|\\.)*"'
+_PROPERTY_START = r'PropertyInfo\s*\{\s*name:\s*"([^"]+)"'
+_PROPERTY_NAME_RE = re.compile(_PROPERTY_START)
+_PROPERTY_BLOCK_RE = re.compile(_PROPERTY_START + r'(?:[^"}]|' + _RUST_STRING + r')*?(?=\bformat:|\})')
+_EXAMPLES_FIELD_RE = re.compile(r'(examples_(unity|mozilla):\s*)(?:Some\(' + _RUST_STRING + r'\)|None)')
+
+# Escapes example text for a Rust string literal in one pass
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\\\\\', '"': '\\"', '\n': '\\n'})
+
+# Kinds of markdown lines
+_BLANK = 'blank'
+_CODE = 'code'  # indented by at least 4 spaces
+_HEADING = 'heading'
+_INDENT = 'indent'  # indented by 1 to 3 spaces
+_TEXT = 'text'
+# Kinds of non-blank, non-code lines, classified by their first character
+_LINE_KINDS = {'#': _HEADING, ' ': _INDENT}
+
+def tokenize_markdown(lines):
+    """Classify markdown lines once so that every parser can share them, yields (kind, line, stripped) tuples
+
+    lines can be any iterable of lines, including an open file, which is read lazily
+    """
+    for line in lines:
+        line = line.rstrip('\n')
+        stripped = line.strip()
+        if not stripped:
+            kind = _BLANK
+        elif line[:4] == '    ':
+            kind = _CODE
+        else:
+            kind = _LINE_KINDS.get(line[:1], _TEXT)
+        yield kind, line, stripped
+
+class _FormatsState:
+    """State of the property formats parser"""
+    __slots__ = ('formats', 'in_css_example')
+    
+    def __init__(self):
+        self.formats = {}
+        self.in_css_example = False
+
+def _feed_format_line(state, kind, line, trimmed):
+    """Feed one markdown token to the property formats parser"""
+    # Formats and CSS example blocks only appear in indented code, other lines are skipped in one check
+    if kind != _CODE:
+        return
+    
+    # Check if we're entering or leaving a code block
+    if trimmed.startswith('```'):
+        return
+    
+    # Detect CSS example blocks
+    if trimmed.startswith('.') and '{' in trimmed:
+        state.in_css_example = True
+    if trimmed == '}' and state.in_css_example:
+        state.in_css_example = False
+        return
+    
+    # Skip if we're in a CSS example block
+    if state.in_css_example:
+        return
+    
+    # Skip comments
+    if trimmed.startswith(('/*', '*/')):
+        return
+    
+    # Look for property definitions (property: format)
+    head, sep, tail = trimmed.partition(':')
+    if not sep:
+        return
+    property_name = head.strip()
+    format_spec = tail.strip()
+    
+    # Skip empty property names or format specs
+    if not property_name or not format_spec:
+        return
+    
+    # Skip CSS selectors and other non-property lines
+    if ('.' in property_name or '#' in property_name or 
+        ' ' in property_name or property_name.startswith('@')):
+        return
+    
+    # Skip lines that look like CSS values, short ones (like 'initial;') are rejected
+    # by length before any substring scan
+    if (format_spec.endswith(';') and 
+        (len(format_spec) < 20 or 'px' in format_spec or 'red' in format_spec or 
+         'blue' in format_spec or '0.5' in format_spec)):
+        return
+    
+    # Only process lines that look like actual format specifications
+    if '<' not in format_spec and '|' not in format_spec:
+        return
+    
+    # Property names are interned, so the lookups while rewriting compare by identity
+    state.formats[sys.intern(property_name)] = format_spec
+
+def parse_markdown_formats(tokens):
+    """Parse the tokenized markdown file to extract property formats"""
+    state = _FormatsState()
+    for kind, line, trimmed in tokens:
+        _feed_format_line(state, kind, line, trimmed)
+    return state.formats
+
+class _ExamplesState:
+    """State shared by the examples parsers"""
+    __slots__ = ('examples', 'current_property', 'buffer')
+    
+    def __init__(self):
+        self.examples = {}
+        self.current_property = None
+        self.buffer = []
+    
+    def flush(self):
+        """Save the buffered examples for the current property, if any"""
+        if self.current_property and self.buffer:
+            self.examples[self.current_property] = '\n'.join(self.buffer)
+            self.buffer = []
+
+class _UnityExamplesState(_ExamplesState):
+    """State of the Unity examples parser, shared by the line handlers"""
+    __slots__ = ('in_examples_section', 'usage_examples')
+    
+    def __init__(self):
+        super().__init__()
+        self.in_examples_section = False
+        # Usage examples found anywhere in indented code, by property, a dict is used as an ordered set
+        self.usage_examples = {}
+    
+    def finish(self):
+        """Flush the last property and merge in the usage examples, returns the examples by property"""
+        # Handle last property
+        self.flush()
         
-        # Collect example code blocks
-        elif in_examples_section and current_property:
-            if line.startswith('    ') and line.strip():
-                # This is an indented code line
-                code_line = line[4:]  # Remove indentation
-                if ':' in code_line and not code_line.strip().startswith('//'):
-                    # Clean up the example - remove property name if it's duplicated
-                    if code_line.strip().startswith(current_property + ':'):
-                        # Extract just the value part
-                        value_part = code_line.strip()[len(current_property + ':'):].strip()
-                        examples_buffer.append(f"{current_property}: {value_part}")
-                    else:
-                        examples_buffer.append(code_line.strip())
-            elif line.strip() and not line.startswith(' '):
-                # End of examples section
-                if examples_buffer:
-                    property_examples[current_property] = '\n'.join(examples_buffer).strip()
-                    examples_buffer = []
-                in_examples_section = False
-    
-    # Handle last property
-    if current_property and examples_buffer:
-        property_examples[current_property] = '\n'.join(examples_buffer).strip()
-    
-    # Now search for ALL property examples by looking for property names directly in indented code
+        for prop_name, examples in self.usage_examples.items():
+            # Skip if we already have examples for this property from headings
+            if prop_name not in self.examples:
+                self.examples[prop_name] = '\n'.join(examples)
+        return self.examples
+
+def _is_unity_examples_marker(line, stripped):
+    """Check whether a line starts an "Examples" section"""
+    return stripped == '**Examples**' or stripped.lower() == 'examples' or 'USS examples' in line
+
+def _handle_unity_heading(state, line, stripped):
+    """Handle a line starting with '#'"""
+    # Only ### property-name or ## property-name start a property section
+    if not line.startswith('##'):
+        _handle_unity_text(state, line, stripped)
+        return
+    
+    # Save previous property examples if any
+    state.flush()
+    
+    # Extract property name from heading
+    heading_text = line.strip('#').strip()
+    if '`' in heading_text:
+        # Extract property name from backticks
+        match = _BACKTICK_RE.search(heading_text)
+        if match:
+            state.current_property = sys.intern(match.group(1))
+            state.in_examples_section = False
+    else:
+        state.current_property = None
+        state.in_examples_section = False
+
+def _handle_unity_indented(state, line, stripped):
+    """Handle a line indented by 1 to 3 spaces"""
+    if _is_unity_examples_marker(line, stripped):
+        state.in_examples_section = True
+        state.buffer = []
+
+def _handle_unity_code(state, line, stripped):
+    """Handle an indented code line"""
+    if _is_unity_examples_marker(line, stripped):
+        state.in_examples_section = True
+        state.buffer = []
+        return
+    
+    # Collect example code blocks
+    if not (state.in_examples_section and state.current_property):
+        return
+    if ':' in stripped and not stripped.startswith('//'):
+        current_property = state.current_property
+        # Clean up the example - remove property name if it's duplicated
+        if stripped.startswith(current_property + ':') and len(stripped) > len(current_property) + 1:
+            # Extract just the value part, entries are kept free of surrounding whitespace
+            value_part = stripped[len(current_property) + 1:].strip()
+            state.buffer.append(f"{current_property}: {value_part}")
+        else:
+            state.buffer.append(stripped)
+
+def _handle_unity_text(state, line, stripped):
+    """Handle any other line"""
+    if _is_unity_examples_marker(line, stripped):
+        state.in_examples_section = True
+        state.buffer = []
+        return
+    
+    # Any non-indented text ends the examples section
+    if state.in_examples_section and state.current_property:
+        state.flush()
+        state.in_examples_section = False
+
+# Line handlers of the Unity examples parser, keyed by line kind, blank lines are skipped
+_UNITY_LINE_HANDLERS = {
+    _CODE: _handle_unity_code,
+    _HEADING: _handle_unity_heading,
+    _INDENT: _handle_unity_indented,
+    _TEXT: _handle_unity_text,
+}
+
+def _collect_unity_usage_example(state, line, code_line):
+    """Collect an indented usage example line (ending with semicolon) under its property name"""
+    if ':' not in code_line or not code_line.endswith(';'):
+        return
+    
+    # Skip comments and format strings (contain | or < > characters)
+    if code_line.startswith(('/*', '//')):
+        return
+    if '|' in code_line or '<' in code_line or '>' in code_line:
+        return
+    
+    prop_name = sys.intern(code_line.partition(':')[0].strip())
+    state.usage_examples.setdefault(prop_name, {})[code_line] = None
+
+def _feed_unity_example_line(state, kind, line, stripped):
+    """Feed one markdown token to the Unity examples parser"""
+    if kind == _BLANK:
+        return
+    _UNITY_LINE_HANDLERS[kind](state, line, stripped)
+    if kind == _CODE:
+        _collect_unity_usage_example(state, line, stripped)
+
+def parse_unity_examples(tokens):
+    """Parse tokenized Unity USS documentation to extract property examples"""
+    # Look for properties with ### headings
+    # At the same time search for ALL property examples by looking for property names directly in indented code
     # This will catch properties that don't have explicit section headings
     # Only extract actual usage examples (ending with semicolon), not format strings
+    state = _UnityExamplesState()
+    for kind, line, stripped in tokens:
+        _feed_unity_example_line(state, kind, line, stripped)
+    return state.finish()
+
+def parse_unity(tokens):
+    """Parse tokenized Unity USS documentation in a single pass, returns (property formats, property examples)"""
+    formats_state = _FormatsState()
+    examples_state = _UnityExamplesState()
+    for kind, line, stripped in tokens:
+        _feed_format_line(formats_state, kind, line, stripped)
+        _feed_unity_example_line(examples_state, kind, line, stripped)
+    return formats_state.formats, examples_state.finish()
+
+# Section flags of the Mozilla examples parser, packed into one int
+_IN_SYNTAX = 1
+_IN_EXAMPLES = 2
+_IN_TRY_IT = 4
+_IN_CSS_BLOCK = 8
+
+class _MozillaExamplesState(_ExamplesState):
+    """State of the Mozilla examples parser"""
+    __slots__ = ('flags', 'prop_prefix')
     
-    for line in lines:
-        if line.startswith('    ') and ':' in line and line.strip().endswith(';'):
-            code_line = line[4:].strip()  # Remove indentation
-            
-            # Skip comments and invalid lines
-            if code_line.startswith('/*') or code_line.startswith('//'):
-                continue
-                
-            # Extract property name
-            if ':' in code_line:
-                prop_name = code_line.split(':')[0].strip()
-                
-                # Skip if we already have examples for this property from headings
-                if prop_name in property_examples:
-                    continue
-                
-                # Skip format strings (contain | or < > characters)
-                if '|' in code_line or '<' in code_line or '>' in code_line:
-                    continue
-                    
-                # This looks like a real usage example
-                if prop_name not in property_examples:
-                    property_examples[prop_name] = []
-                    
-                # Find all examples for this property
-                examples = []
-                for search_line in lines:
-                    if search_line.startswith('    ') and f'{prop_name}:' in search_line and search_line.strip().endswith(';'):
-                        search_code_line = search_line[4:].strip()
-                        # Skip format strings and comments
-                        if ('|' not in search_code_line and '<' not in search_code_line and '>' not in search_code_line and 
-                            not search_code_line.startswith('/*') and not search_code_line.startswith('//')):                            
-                            examples.append(search_code_line)
-                
-                if examples:
-                    # Remove duplicates while preserving order
-                    unique_examples = []
-                    seen = set()
-                    for example in examples:
-                        if example not in seen:
-                            unique_examples.append(example)
-                            seen.add(example)
-                    property_examples[prop_name] = '\n'.join(unique_examples)
-    
-    return property_examples
+    def __init__(self):
+        super().__init__()
+        self.flags = 0
+        # Start of a declaration of the current property, set with the property
+        self.prop_prefix = None
 
-def parse_mozilla_examples(md_content):
-    """Parse Mozilla CSS documentation to extract property examples"""
-    property_examples = {}
-    lines = md_content.split('\n')
-    current_property = None
-    in_syntax_section = False
-    in_examples_section = False
-    in_try_it_section = False
-    in_css_block = False
-    examples_buffer = []
-    
-    for i, line in enumerate(lines):
-        original_line = line
-        line_stripped = line.strip()
+def parse_mozilla_examples(tokens):
+    """Parse tokenized Mozilla CSS documentation to extract property examples"""
+    state = _MozillaExamplesState()
+    
+    # Walk the lines with one line of lookahead, the last line has an empty lookahead
+    tokens, lookahead = tee(tokens)
+    next(lookahead, None)
+    for (kind, line, line_stripped), (_, _, next_stripped) in zip_longest(tokens, lookahead, fillvalue=(_BLANK, '', '')):
+        line_lower = line_stripped.lower()
         
         # Check for property headings (look for lines followed by ===)
-        if i + 1 < len(lines) and lines[i + 1].strip().startswith('==='):
+        if next_stripped.startswith('==='):
             # Save previous property examples if any
-            if current_property and examples_buffer:
-                property_examples[current_property] = '\n'.join(examples_buffer).strip()
-                examples_buffer = []
-            
-            current_property = line_stripped.lower()
-            in_syntax_section = False
-            in_examples_section = False
-            in_try_it_section = False
-            in_css_block = False
+            state.flush()
+            state.current_property = sys.intern(line_lower)
+            state.prop_prefix = line_lower + ':'
+            state.flags = 0
             continue
             
-        # Check for relevant sections
-        if '[try it]' in line_stripped.lower():
-            in_try_it_section = True
-            in_syntax_section = False
-            in_examples_section = False
+        # Check for relevant sections, a CSS block stays open across section changes
+        if '[try it]' in line_lower:
+            state.flags = (state.flags & _IN_CSS_BLOCK) | _IN_TRY_IT
             continue
-        elif '[syntax]' in line_stripped.lower():
-            in_syntax_section = True
-            in_examples_section = False
-            in_try_it_section = False
+        elif '[syntax]' in line_lower:
+            state.flags = (state.flags & _IN_CSS_BLOCK) | _IN_SYNTAX
             continue
-        elif '[examples]' in line_stripped.lower():
-            in_examples_section = True
-            in_syntax_section = False
-            in_try_it_section = False
+        elif '[examples]' in line_lower:
+            state.flags = (state.flags & _IN_CSS_BLOCK) | _IN_EXAMPLES
             continue
         elif line_stripped.startswith('[') and line_stripped.endswith(']'):
-            in_syntax_section = False
-            in_examples_section = False
-            in_try_it_section = False
-            in_css_block = False
+            state.flags = 0
             continue
             
         # Handle CSS code blocks (marked with 'css' on its own line)
         if line_stripped == 'css':
-            in_css_block = True
+            state.flags |= _IN_CSS_BLOCK
             continue
-        elif in_css_block and (line_stripped.startswith('The ') or line_stripped.startswith('###') or (line_stripped and not line.startswith(' '))):
-            in_css_block = False
+        elif state.flags & _IN_CSS_BLOCK and (line_stripped.startswith(('The ', '###')) or kind == _HEADING or kind == _TEXT):
+            state.flags &= ~_IN_CSS_BLOCK
             
         # Extract examples from relevant sections
-        if current_property and (in_syntax_section or in_examples_section or in_try_it_section or in_css_block):
+        current_property = state.current_property
+        if current_property and state.flags:
             # Look for CSS property declarations in Try it section
-            if in_try_it_section and ':' in line and ';' in line:
-                # Extract property: value; patterns
-                prop_match = re.search(r'([a-zA-Z-]+)\\s*:\\s*([^;]+);', line)
-                if prop_match:
-                    prop_name = prop_match.group(1).strip().lower()
-                    value = prop_match.group(2).strip()
-                    if prop_name == current_property and value:
-                        examples_buffer.append(f"{prop_name}: {value};")
+            if state.flags & _IN_TRY_IT and ':' in line and ';' in line:
+                # Extract property: value; patterns, only the current property is kept so
+                # lines that don't mention it skip the regex
+                if current_property in line_lower:
+                    prop_match = _CSS_DECL_RE.search(line)
+                    if prop_match:
+                        prop_name = prop_match.group(1).strip().lower()
+                        value = prop_match.group(2).strip()
+                        if prop_name == current_property and value:
+                            state.buffer.append(f"{prop_name}: {value};")
             
             # Look for CSS property declarations in CSS blocks
-            elif in_css_block and line.startswith('    ') and ':' in line:
-                code_line = line[4:].strip()  # Remove indentation
-                if current_property in code_line and ':' in code_line:
-                    # Extract the value part
-                    if not code_line.startswith('/*') and not code_line.startswith('<'):
-                        examples_buffer.append(code_line)
+            elif state.flags & _IN_CSS_BLOCK and kind == _CODE and line_stripped.startswith(state.prop_prefix):
+                state.buffer.append(line_stripped)
     
     # Save the last property's examples
-    if current_property and examples_buffer:
-        property_examples[current_property] = '\n'.join(examples_buffer).strip()
+    state.flush()
+    return state.examples
+
+def _replace_example_fields(block, unity_value, mozilla_value):
+    """Replace the examples_unity and examples_mozilla values of a block in one scan,
+    returns the new block and whether any of the fields was found"""
+    values = {'unity': unity_value, 'mozilla': mozilla_value}
+    chunks = []
+    last_end = 0
+    for match in _EXAMPLES_FIELD_RE.finditer(block):
+        # Only the first occurrence of each field is replaced
+        value = values.pop(match.group(2), None)
+        if value is None:
+            continue
+        chunks.append(block[last_end:match.end(1)])
+        chunks.append(value)
+        last_end = match.end()
     
-    return property_examples
+    if not chunks:
+        return block, False
+    chunks.append(block[last_end:])
+    return ''.join(chunks), True
+
+def _render_example(example):
+    """Render an example as the Rust value of an optional string field"""
+    if not example:
+        return 'None'
+    return f'Some("{example.translate(_ESCAPE_TABLE)}")'
+
+def apply_updates(content, property_formats, unity_examples=None, mozilla_examples=None):
+    """Apply formats and examples to the content of property_data.rs, returns the new content and
+    the number of updated properties"""
+    property_formats = property_formats or {}
+    unity_examples = unity_examples or {}
+    mozilla_examples = mozilla_examples or {}
+    
+    # Collect all properties that need updating in a deterministic order, mapped to their rendered
+    # (unity, mozilla) field values, so that rewriting a block is only a dict lookup
+    combined = {
+        prop_name: (_render_example(unity_examples.get(prop_name)), _render_example(mozilla_examples.get(prop_name)))
+        for prop_name in dict.fromkeys(chain(property_formats, unity_examples, mozilla_examples))
+    }
+    
+    # Find the properties that exist in the content with a cheap scan of the names, before any rewriting
+    file_names = set(_PROPERTY_NAME_RE.findall(content))
+    missing_names = combined.keys() - file_names
+    if missing_names:
+        print(f"Warning: No PropertyInfo found for properties: {', '.join(sorted(missing_names))}")
+    if missing_names.issuperset(combined):
+        return content, 0
+    
+    # Rebuild the content from the untouched text between blocks and the updated blocks
+    updated_count = 0
+    chunks = []
+    last_end = 0
+    for match in _PROPERTY_BLOCK_RE.finditer(content):
+        prop_name = sys.intern(match.group(1))
+        entry = combined.get(prop_name)
+        if entry is None:
+            continue
+        unity_value, mozilla_value = entry
+        
+        # Update examples_unity and examples_mozilla fields
+        block, found = _replace_example_fields(match.group(0), unity_value, mozilla_value)
+        
+        if found:
+            updated_count += 1
+        else:
+            print(f"Warning: Could not find examples fields for property '{prop_name}'")
+        
+        chunks.append(content[last_end:match.start()])
+        chunks.append(block)
+        last_end = match.end()
+    chunks.append(content[last_end:])
+    return ''.join(chunks), updated_count
 
 def update_property_data(file_path, property_formats, unity_examples=None, mozilla_examples=None):
     """Update the property_data.rs file with formats and examples"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Collect all properties that need updating
-    all_properties = set()
-    if property_formats:
-        all_properties.update(property_formats.keys())
-    if unity_examples:
-        all_properties.update(unity_examples.keys())
-    if mozilla_examples:
-        all_properties.update(mozilla_examples.keys())
+    # Nothing to update, leave the file untouched
+    if not (property_formats or unity_examples or mozilla_examples):
+        print("Updated 0 properties with formats and/or examples")
+        return
     
-    updated_count = 0
+    # Binary I/O keeps the file's line endings exactly as they are
+    path = Path(file_path)
+    content = path.read_bytes().decode('utf-8')
+    new_content, updated_count = apply_updates(content, property_formats, unity_examples, mozilla_examples)
     
-    # Process line by line
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Look for name: "property-name" lines
-        if 'name:' in line and '"' in line:
-            # Extract property name from the line
-            start_quote = line.find('"') + 1
-            end_quote = line.find('"', start_quote)
-            if start_quote > 0 and end_quote > start_quote:
-                prop_name = line[start_quote:end_quote]
-                
-                if prop_name in all_properties:
-                    # Get the values for this property
-                    unity_example = unity_examples.get(prop_name) if unity_examples else None
-                    mozilla_example = mozilla_examples.get(prop_name) if mozilla_examples else None
-                    
-                    # Find the examples_unity and examples_mozilla lines
-                    j = i + 1
-                    unity_line_idx = None
-                    mozilla_line_idx = None
-                    
-                    while j < len(lines) and not lines[j].strip().startswith('}'):
-                        if 'examples_unity:' in lines[j]:
-                            unity_line_idx = j
-                        elif 'examples_mozilla:' in lines[j]:
-                            mozilla_line_idx = j
-                        elif lines[j].strip().startswith('format:'):
-                            break
-                        j += 1
-                    
-                    # Update examples_unity line
-                    if unity_line_idx is not None:
-                        indent = len(lines[unity_line_idx]) - len(lines[unity_line_idx].lstrip())
-                        if unity_example:
-                            escaped_unity = unity_example.replace('\\', '\\\\\\\\')
-                            escaped_unity = escaped_unity.replace('"', '\\"')
-                            escaped_unity = escaped_unity.replace('\n', '\\n')
-                            lines[unity_line_idx] = ' ' * indent + f'examples_unity: Some("{escaped_unity}"),\n'
-                        else:
-                            lines[unity_line_idx] = ' ' * indent + 'examples_unity: None,\n'
-                    
-                    # Update examples_mozilla line
-                    if mozilla_line_idx is not None:
-                        indent = len(lines[mozilla_line_idx]) - len(lines[mozilla_line_idx].lstrip())
-                        if mozilla_example:
-                            escaped_mozilla = mozilla_example.replace('\\', '\\\\\\\\')
-                            escaped_mozilla = escaped_mozilla.replace('"', '\\"')
-                            escaped_mozilla = escaped_mozilla.replace('\n', '\\n')
-                            lines[mozilla_line_idx] = ' ' * indent + f'examples_mozilla: Some("{escaped_mozilla}"),\n'
-                        else:
-                            lines[mozilla_line_idx] = ' ' * indent + 'examples_mozilla: None,\n'
-                    
-                    if unity_line_idx is not None or mozilla_line_idx is not None:
-                        updated_count += 1
-                    else:
-                        print(f"Warning: Could not find examples fields for property '{prop_name}'")
-                        
-        i += 1
-    
-    # Write the updated content back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    # Write the updated content back in one go, only if anything changed
+    if new_content != content:
+        path.write_bytes(new_content.encode('utf-8'))
     
     print(f"Updated {updated_count} properties with formats and/or examples")
 
 def find_project_root():
     """Find the project root by looking for Cargo.toml"""
-    current_path = Path(__file__).resolve()
-    
-    # Start from the script's directory and go up
-    for parent in [current_path.parent] + list(current_path.parents):
+    # Start from the script's directory and go up, the first of the parents is the script's directory
+    for parent in Path(__file__).resolve().parents:
         if (parent / 'Cargo.toml').exists():
             return parent
     
     # If not found, raise an error
     raise FileNotFoundError("Could not find project root (Cargo.toml not found)")
 
-if __name__ == '__main__':
+def main():
+    """Update property_data.rs from the Unity and Mozilla documentation"""
     # Find project root dynamically
     project_root = find_project_root()
     print(f"Project root detected: {project_root}")
     
-    # Read the Unity USS documentation file
+    # Parse property formats and examples from Unity documentation, streaming the file line by line
     unity_md_file_path = project_root / 'data' / 'USS_property_format_6.0.md'
     with open(unity_md_file_path, 'r', encoding='utf-8') as f:
-        unity_md_content = f.read()
-    
-    # Read the Mozilla CSS documentation file
-    mozilla_md_file_path = project_root / 'data' / 'Mozilla_CSS_properties_2025.md'
-    with open(mozilla_md_file_path, 'r', encoding='utf-8') as f:
-        mozilla_md_content = f.read()
-    
-    # Parse property formats from Unity documentation
-    property_formats = parse_markdown_formats(unity_md_content)
+        property_formats, unity_examples = parse_unity(tokenize_markdown(f))
     print(f"Found {len(property_formats)} property formats in Unity documentation")
-    
-    # Parse examples from Unity documentation
-    unity_examples = parse_unity_examples(unity_md_content)
     print(f"Found {len(unity_examples)} property examples in Unity documentation")
     
-    # Parse examples from Mozilla documentation
-    mozilla_examples = parse_mozilla_examples(mozilla_md_content)
+    # Parse examples from Mozilla documentation, streaming the file line by line
+    mozilla_md_file_path = project_root / 'data' / 'Mozilla_CSS_properties_2025.md'
+    with open(mozilla_md_file_path, 'r', encoding='utf-8') as f:
+        mozilla_examples = parse_mozilla_examples(tokenize_markdown(f))
     print(f"Found {len(mozilla_examples)} property examples in Mozilla documentation")
     
-    # Debug: Print what Unity examples were found
-    print("Unity examples found:")
-    for prop, example in unity_examples.items():
-        print(f"  {prop}: {example[:50]}..." if len(example) > 50 else f"  {prop}: {example}")
-    print()
+    # Debug: Print what Unity examples were found, set DEBUG_UPDATE_FORMATS to enable
+    if os.environ.get('DEBUG_UPDATE_FORMATS'):
+        debug_lines = ["Unity examples found:"]
+        for prop, example in unity_examples.items():
+            debug_lines.append(f"  {prop}: {example[:50]}..." if len(example) > 50 else f"  {prop}: {example}")
+        sys.stdout.write('\n'.join(debug_lines) + '\n\n')
     
     # Debug: Print some examples
     print("\nSample Unity examples:")
@@ -412,4 +485,7 @@ if __name__ == '__main__':
     property_data_path = project_root / 'src' / 'uss' / 'property_data.rs'
     update_property_data(str(property_data_path), property_formats, unity_examples, mozilla_examples)
     
-    print("\nProperty data file updated successfully!")
\ No newline at end of file
+    print("\nProperty data file updated successfully!")
+
+if __name__ == '__main__':
+    main()